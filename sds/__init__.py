@@ -1,4 +1,4 @@
-from sds import downselect, utils
+from sds import backends, downselect, hierarchical, prefetch, sparse, utils
 from sds.io import load, save
 
 __version__ = "2.0.0"
\ No newline at end of file
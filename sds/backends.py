@@ -0,0 +1,282 @@
+import importlib.util
+import numpy as np
+
+
+def _identity(x):
+    return x
+
+
+# Row transform, accumulator update and starting value of each objective
+_objectives = {
+    "logsum": (np.log, np.add, 0.0),
+    "sum": (_identity, np.add, 0.0),
+    "maxmin": (_identity, np.minimum, np.inf),
+}
+
+
+def check_objective(objective):
+    """
+    Ensures objective is one of the supported objectives.
+
+    Parameters
+    ----------
+    objective : str
+        Objective name.
+
+    Returns
+    -------
+    objective : str
+        Validated objective name.
+
+    """
+    if objective not in _objectives:
+        raise ValueError("Objective {} not recognized.".format(objective))
+    return objective
+
+
+def transform(values, objective):
+    """
+    Apply the objective's row transform (e.g., log) to values.
+
+    Parameters
+    ----------
+    values : :obj:`~np.ndarray`
+        Dissimilarities.
+    objective : str
+        Objective name.
+
+    Returns
+    -------
+    values : :obj:`~np.ndarray`
+        Transformed values, accumulated by the objective.
+
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return _objectives[objective][0](np.asarray(values, dtype=float))
+
+
+class NumpyBackend:
+    """
+    Default compute backend built on vectorized NumPy calls.
+
+    A backend implements the kernels of the greedy search: the row extrema
+    scan used to seed the search (and bound candidates), and the fused
+    update that accumulates a chosen row into the running score and returns
+    the best remaining candidate.
+    """
+
+    name = "numpy"
+
+    def extrema(self, block):
+        """
+        Row-wise NaN-aware maximum, minimum and NaN count of a block of rows.
+
+        Parameters
+        ----------
+        block : :obj:`~np.ndarray`
+            Two dimensional array of matrix rows.
+
+        Returns
+        -------
+        rowmax, rowmin, nancount : :obj:`~np.ndarray`
+            Per-row maximum and minimum ignoring np.nan (np.nan for all-NaN
+            rows), and number of np.nan entries.
+
+        """
+        nans = np.isnan(block)
+        count = nans.sum(axis=1)
+        empty = count == block.shape[1]
+        rowmax = np.where(nans, -np.inf, block).max(axis=1, initial=-np.inf)
+        rowmin = np.where(nans, np.inf, block).min(axis=1, initial=np.inf)
+        rowmax[empty] = np.nan
+        rowmin[empty] = np.nan
+        return rowmax, rowmin, count
+
+    def transform(self, values, objective):
+        """
+        Apply the objective's row transform (e.g., log) to values.
+        """
+        return transform(values, objective)
+
+    def init(self, N, objective):
+        """
+        Starting score array for N candidates.
+        """
+        return np.full(N, _objectives[objective][2])
+
+    def update(self, score, row, objective, active=None):
+        """
+        Accumulate a chosen row into score in place and find the best candidate.
+
+        Parameters
+        ----------
+        score : :obj:`~np.ndarray`
+            Running score of every candidate, updated in place.
+        row : :obj:`~np.ndarray`
+            Matrix row of the most recently chosen item.
+        objective : str
+            Objective name.
+        active : :obj:`~np.ndarray`
+            Indices of candidates to update. All candidates if None.
+
+        Returns
+        -------
+        index : int
+            Index of the highest scoring (non-NaN) candidate, the first on ties,
+            or -1 if every updated candidate scores np.nan.
+
+        """
+        transform, combine, _ = _objectives[objective]
+        if active is None:
+            values = combine(score, transform(row), out=score)
+        else:
+            values = combine(score[active], transform(row[active]))
+            score[active] = values
+        nans = np.isnan(values)
+        if nans.all():
+            return -1
+        index = int(np.argmax(np.where(nans, -np.inf, values)))
+        return index if active is None else int(active[index])
+
+
+class NumbaBackend(NumpyBackend):
+    """
+    JIT-compiled CPU backend. Requires numba.
+
+    Fuses transform, accumulation and argmax into a single pass over the
+    score array, and computes row extrema in a single pass over each block.
+    """
+
+    name = "numba"
+
+    def __init__(self):
+        """
+        Initialize :obj:`~sds.backends.NumbaBackend` instance.
+        """
+        self._extrema, self._update = _numba_kernels()
+
+    def extrema(self, block):
+        return self._extrema(np.ascontiguousarray(block, dtype=float))
+
+    def update(self, score, row, objective, active=None):
+        mode = list(_objectives).index(objective)
+        row = np.asarray(row, dtype=float)
+        if active is None:
+            index = self._update(score, row, np.empty(0, dtype=np.intp), False, mode)
+        else:
+            index = self._update(score, row, active.astype(np.intp), True, mode)
+        return int(index)
+
+
+_kernels = None
+
+
+def _numba_kernels():
+    """
+    Compile (once) and return the numba kernels.
+    """
+    global _kernels
+    if _kernels is not None:
+        return _kernels
+
+    import numba
+
+    @numba.njit(cache=True)
+    def extrema(block):
+        rows, cols = block.shape
+        rowmax = np.empty(rows)
+        rowmin = np.empty(rows)
+        count = np.zeros(rows, dtype=np.int64)
+        for i in range(rows):
+            mx = -np.inf
+            mn = np.inf
+            for j in range(cols):
+                x = block[i, j]
+                if np.isnan(x):
+                    count[i] += 1
+                else:
+                    mx = max(mx, x)
+                    mn = min(mn, x)
+            if count[i] == cols:
+                mx = np.nan
+                mn = np.nan
+            rowmax[i] = mx
+            rowmin[i] = mn
+        return rowmax, rowmin, count
+
+    @numba.njit(cache=True)
+    def update(score, row, active, use_active, mode):
+        # mode follows the order of _objectives: logsum, sum, maxmin
+        size = active.shape[0] if use_active else score.shape[0]
+        best = -1
+        best_value = -np.inf
+        for k in range(size):
+            j = active[k] if use_active else k
+            x = row[j]
+            if mode == 0:
+                x = np.log(x)
+            s = score[j]
+            if np.isnan(s) or np.isnan(x):
+                s = np.nan
+            elif mode == 2:
+                s = min(s, x)
+            else:
+                s = s + x
+            score[j] = s
+            if not np.isnan(s) and (best < 0 or s > best_value):
+                best = j
+                best_value = s
+        return best
+
+    _kernels = (extrema, update)
+    return _kernels
+
+
+_backends = {"numpy": NumpyBackend, "numba": NumbaBackend}
+
+
+def available():
+    """
+    List names of compute backends usable in this environment.
+
+    Returns
+    -------
+    names : list of str
+        Available backend names, preferred first.
+
+    """
+    names = ["numpy"]
+    if importlib.util.find_spec("numba") is not None:
+        names.insert(0, "numba")
+    return names
+
+
+def get_backend(backend=None):
+    """
+    Resolve a compute backend.
+
+    Parameters
+    ----------
+    backend : str, backend instance or None
+        Backend name ("numpy", "numba"), an existing backend instance, or
+        "auto" to pick the preferred available backend. None selects
+        "numpy", which avoids the numba import and JIT cost in short-lived
+        processes.
+
+    Returns
+    -------
+    backend : :obj:`~sds.backends.NumpyBackend`
+        Backend instance.
+
+    """
+    if backend is None:
+        backend = "numpy"
+    if backend == "auto":
+        backend = available()[0]
+    if isinstance(backend, NumpyBackend):
+        return backend
+    if backend not in _backends:
+        raise ValueError("Backend {} not recognized.".format(backend))
+    if backend not in available():
+        raise ImportError("Backend {} is not available.".format(backend))
+    return _backends[backend]()
@@ -1,11 +1,49 @@
-from sds import utils, io
+from sds import backends, utils, io
+from sds.prefetch import RowPrefetcher, top_candidates
+from sds.sparse import SparseMatrix
 import numpy as np
-import pandas as pd
-from math import log
 
 
-def SDS(matrix, n):
-    return SDSWrapper().run(matrix, n)
+def score_logsum(submatrix):
+    """
+    Summed log dissimilarity over all pairs of a selected submatrix.
+    """
+    with np.errstate(divide="ignore"):
+        return np.nansum(np.log(submatrix)) / 2
+
+
+def score_sum(submatrix):
+    """
+    Summed dissimilarity over all pairs of a selected submatrix.
+    """
+    return np.nansum(submatrix) / 2
+
+
+def score_maxmin(submatrix):
+    """
+    Smallest pairwise dissimilarity within a selected submatrix.
+    """
+    return np.nanmin(submatrix)
+
+
+_scorers = {
+    "logsum": score_logsum,
+    "sum": score_sum,
+    "maxmin": score_maxmin,
+}
+
+
+def _seed_pair(row_mx):
+    """
+    Indices of the most dissimilar pair, from the row maxima of the matrix.
+    """
+    ind1 = np.nanargmax(row_mx)
+    ind2 = ind1 + 1 + np.nanargmax(row_mx[ind1 + 1 :])
+    return ind1, ind2
+
+
+def SDS(matrix, n, **kwargs):
+    return SDSWrapper(**kwargs).run(matrix, n)
 
 
 class SDSWrapper:
@@ -24,8 +62,17 @@ class SDSWrapper:
         Set size of most dissilimar elements to return from population.
         1 < n < N, where N is the full population size.
 
-    matrix : :obj:`~pd.DataFrame`
-        Pandas DataFrame of NxN dimension containing matrix.
+    matrix : :obj:`~pd.DataFrame` or :obj:`~np.ndarray`
+        Pandas DataFrame or numpy array (including :obj:`~np.memmap`) of NxN
+        dimension containing matrix. Arrays are searched without pandas and
+        without being copied. A :obj:`~sds.sparse.SparseMatrix` storing only
+        known pairs is also accepted, with absent entries treated as np.nan.
+
+        A list of such matrices (one per descriptor, e.g., RMSD and collision
+        cross section) searches for diversity across all of them at once.
+        Their weighted contributions to the objective (log dissimilarities
+        for "logsum") are combined row by row during the search, without
+        building a combined matrix.
 
         Square matrix where each row (and by symmetry, column) is an array
         corresponding to a specific item or object, and each element (i,j) the
@@ -37,18 +84,106 @@ class SDSWrapper:
         in the log-summation array once the first of one of the two items is
         chosen. Thus, the second item will never be chosen. In this same
         manner, entire missing items can be represented as arrays of np.nan,
-        as a trick to preserve externally related indexing.
+        as a trick to preserve externally related indexing. Search stops
+        early, reducing n, once every remaining candidate is missing a pair
+        with the selection.
     N : int
         Dimension of matrix object and full population size.
-    res : :obj:`~pd.DataFrame`
-        Resultant Pandas DataFrame of indices for n most dissimilar elements.
+    weights : list of float
+        Non-negative weight of each matrix when a list of matrices is given.
+        Defaults to equal weights.
+    indices : :obj:`~np.ndarray`
+        Resultant array of indices for n most dissimilar elements.
         Ordering is ranked from 1st most dissimilar.
+    res : :obj:`~pd.DataFrame`
+        Resultant Pandas DataFrame of indices for n most dissimilar elements,
+        built from `indices` on first access.
+    objective : str
+        Diversity objective maximized by the greedy search. "logsum" (the
+        default) maximizes the product of pairwise dissimilarities via log
+        summing, "sum" their plain sum, and "maxmin" the smallest pairwise
+        dissimilarity (farthest-point selection).
     final_sum : float
-        Summed dissimilarity
+        Objective value of the result (summed log dissimilarity by default).
+    prune : bool
+        Drop candidates from the greedy loop once their upper bound can no
+        longer reach the selection. Bounds are taken from the row extrema of
+        the (symmetric) matrix, so the ranking is identical to an unpruned
+        search. Bounds are rechecked each time the remaining steps halve, and
+        only the survivors are updated once fewer than a quarter remain.
+    backend : str or backend instance
+        Compute backend for the search kernels (see :mod:`sds.backends`).
+        "numpy" (the default, also selected by None), "numba", or "auto" to
+        detect the fastest available.
+    prefetch : int
+        Number of top-scoring candidates whose rows are read speculatively in
+        the background during each greedy step, overlapping I/O with compute
+        for matrices on slow storage (e.g., memory maps). 0 disables.
+    cache_size : int
+        Maximum number of prefetched rows held at once.
+    seed : str
+        How the initial most dissimilar pair is found. "exact" (the default)
+        scans every row. "sample" scans `seed_rows` random rows and refines
+        the best pair with up to `seed_passes` farthest-point passes. Sampled
+        items without data are redrawn, so at most 2 * seed_rows + seed_passes
+        rows are read unless no sampled item has data, in which case the
+        exact scan is used. Pruning still needs the exact scan for its bounds.
+    seed_rows : int
+        Number of rows sampled by the approximate seed.
+    seed_passes : int
+        Maximum number of farthest-point refinement passes.
+    check_seed : bool
+        Also run the exact scan with a sampled seed and report seed_gap.
+    random_state : int
+        Seed of the row sampler.
+    seed_reads : int
+        Number of rows read by the approximate seed.
+    seed_gap : float
+        Exact maximum dissimilarity minus that of the approximate seed pair,
+        when both are computed.
+    pruned_fraction : float
+        Fraction of the greedy loop's candidate updates skipped by pruning.
+    cache_hits : int
+        Greedy-step rows served from the prefetch cache.
+    cache_misses : int
+        Greedy-step rows read synchronously despite prefetching.
     """
 
-    _defaults = ["n", "matrix"]
-    _default_value = [3, None]
+    _defaults = [
+        "n",
+        "matrix",
+        "objective",
+        "prune",
+        "backend",
+        "prefetch",
+        "cache_size",
+        "weights",
+        "seed",
+        "seed_rows",
+        "seed_passes",
+        "check_seed",
+        "random_state",
+    ]
+    _default_value = [
+        3,
+        None,
+        "logsum",
+        False,
+        None,
+        0,
+        64,
+        None,
+        "exact",
+        64,
+        3,
+        False,
+        None,
+    ]
+    _chunk_size = 1024
+    _prune_every = 8
+    _sparse_at = 0.25
+    _res = None
+    ranks = None
 
     def __init__(self, **kwargs):
         """
@@ -59,22 +194,70 @@ class SDSWrapper:
 
     def _check_matrix(self, matrix):
         """
-        Check matrix is :obj:`pd.DataFrame` and of NxX dimension.
+        Check matrix is :obj:`pd.DataFrame`, :obj:`np.ndarray` or
+        :obj:`~sds.sparse.SparseMatrix` and of NxN dimension.
         """
         return utils.safematrix(matrix)
 
     def set_matrix(self, matrix):
         """
-        Set matrix and dimension attributes.
+        Set matrix (or list of matrices) and dimension attributes.
+        """
+        if isinstance(matrix, (list, tuple)):
+            self.matrix = [self._check_matrix(x) for x in matrix]
+            if len({len(x) for x in self.matrix}) != 1:
+                raise ValueError("Matrices must share the same dimension")
+            self.N = len(self.matrix[0])
+        else:
+            self.matrix = self._check_matrix(matrix)
+            self.N = len(self.matrix)
+
+    def _weights(self):
+        """
+        Check and return per-matrix weights of a multi-metric search.
         """
-        self.matrix = self._check_matrix(matrix)
-        self.N = len(self.matrix)
+        if self.weights is None:
+            return np.ones(len(self.matrix))
+        weights = np.asarray(self.weights, dtype=float)
+        invalid = np.any(weights < 0) or not weights.sum() > 0
+        if weights.shape != (len(self.matrix),) or invalid:
+            raise ValueError(
+                "Weights must be one non-negative value per matrix, not all zero"
+            )
+        return weights
+
+    def _kernel(self):
+        """
+        Objective evaluated by the search kernels and scorers.
+        """
+        objective = backends.check_objective(self.objective)
+        if isinstance(self.matrix, list) and objective == "logsum":
+            # Fused rows are already log transformed, so only sum them
+            return "sum"
+        return objective
+
+    def _fuse(self, read):
+        """
+        Weighted sum of each matrix's transformed values, as read by `read`.
+        """
+        fused = 0
+        for x, weight in zip(self.matrix, self._weights()):
+            if weight:
+                fused = fused + weight * backends.transform(read(x), self.objective)
+        return fused
 
     def _check_n(self, n):
         """
         Check and reduce n to maximum number of dimension.
+
+        With sampled seeding the full matrix is not scanned, so n is only
+        reduced to N here. Either way, search stops early (reducing n) once
+        the remaining items are missing data.
         """
-        M = len(self.matrix.dropna(how="all"))
+        if self.seed == "sample":
+            return min(n, self.N)
+        _, _, row_nan = self._extrema(backends.NumpyBackend())
+        M = np.count_nonzero(row_nan < self.N)
         if n > M:
             n = M
         return n
@@ -94,57 +277,232 @@ class SDSWrapper:
         """
         if self.matrix is None:
             raise ("Matrix must be set prior to search.")
-        # First grab matrix indices of the two most dissimilar geometries
-        row_mx = []
+        objective = self._kernel()
+        backend = backends.get_backend(self.backend)
+
+        if self.seed not in ("exact", "sample"):
+            raise ValueError("Seed {} not recognized.".format(self.seed))
 
-        for i in range(self.N):
-            row_mx.append(np.nanmax(self.matrix.loc[i]))
-        ind1 = np.nanargmax(row_mx)
-        ind2 = ind1 + 1 + np.nanargmax(row_mx[ind1 + 1 :])
+        # First grab matrix indices of the two most dissimilar geometries.
+        # The exact scan reads every row; it is also needed for pruning
+        # bounds, and to measure the gap of a sampled seed.
+        if self.seed == "exact" or self.prune or self.check_seed:
+            row_mx, row_mn, row_nan = self._extrema(backend)
+        if self.seed == "sample":
+            ind1, ind2, value = self._sample_pair(backend)
+            if self.check_seed:
+                self.seed_gap = np.nanmax(row_mx) - value
+        else:
+            ind1, ind2 = _seed_pair(row_mx)
 
         # Initialize the dissimilar matrix with the two most dissimilar
-        disarray = [np.array(self.matrix.loc[ind1]), np.array(self.matrix.loc[ind2])]
+        disarray = [self._row(ind1), self._row(ind2)]
         indices = [ind1, ind2]
 
         # Find n-2 other most dissimilar
         # Multiply the rows of the n-1 dissimilar set. Or,
         # use log summing if N is large (e.g. 50000) to avoid
         # exceeding floating point machine precision.
-        # This script uses log summing.
+        # This script uses log summing by default; other objectives
+        # accumulate a plain sum or a running minimum instead.
         # The index of the largest value is the index of the nth
         # item which makes the nth dissimilar set.
 
-        # Initialize array for log summing
-        logsum = [0 for x in range(self.N)]
-        logsum += np.log(disarray[0])
+        # Initialize array for accumulating the objective
+        score = backend.init(self.N, objective)
+        backend.update(score, disarray[0], objective)
+
+        active = None
+        if self.prune:
+            # Per-step bounds on a candidate's objective increment. Any
+            # missing (NaN) pair beyond the diagonal may eliminate the
+            # candidate.
+            upper = backend.transform(row_mx, objective)
+            lower = backend.transform(row_mn, objective)
+            lower[row_nan > 1] = -np.inf
+            alive = np.arange(self.N)
+            updates = check = 0
+
+        read = self._row
+        if self.prefetch:
+            # Read rows of the likely next picks in the background
+            prefetcher = RowPrefetcher(self._row, cache_size=self.cache_size)
+            read = prefetcher.get
+
+        try:
+            for i in range(self.n - 2):
+                indn = backend.update(score, disarray[-1], objective, active)
+                if indn < 0:
+                    # Every remaining candidate is missing a pair with the
+                    # selection, so fewer than n items can be chosen
+                    break
+                if self.prune:
+                    updates += self.N if active is None else len(active)
+                if self.prune and i == check:
+                    # Bounds loosen with the steps remaining, so they are
+                    # only rechecked once those have (about) halved
+                    remaining = self.n - 2 - i
+                    alive = self._prune(alive, score, remaining, upper, lower)
+                    check = i + max(self._prune_every, remaining // 2)
+                    # Pruned candidates can never win, so full (contiguous)
+                    # updates stay exact until indexing only the survivors
+                    # is cheaper
+                    if active is not None or len(alive) < self._sparse_at * self.N:
+                        active = alive
+                if self.prefetch and i < self.n - 3:
+                    ahead = top_candidates(score, self.prefetch + 1, active)
+                    prefetcher.prefetch(ahead[ahead != indn])
+                indices.append(indn)
+                disarray.append(read(indn))
+        finally:
+            if self.prefetch:
+                prefetcher.close()
+                self.cache_hits = prefetcher.hits
+                self.cache_misses = prefetcher.misses
+
+        if self.prune:
+            total = self.N * (len(indices) - 2)
+            self.pruned_fraction = 1 - updates / total if total else 0.0
+
+        self.indices = np.array(indices)
+        self.n = len(indices)
+        self.ranks = None
+        self._res = None
+
+    @property
+    def res(self):
+        """
+        Resultant Pandas DataFrame of ranked indices.
+        """
+        if self._res is None:
+            self._res = utils.ranking(self.indices, self.ranks)
+        return self._res
+
+    @res.setter
+    def res(self, res):
+        self._res = res
+
+    def _sample_pair(self, backend):
+        """
+        Approximate the most dissimilar pair with a bounded number of row reads.
+
+        The best pair among `seed_rows` randomly sampled rows is refined by up
+        to `seed_passes` farthest-point passes: read the row of the current
+        partner and move to its most dissimilar item while that improves the
+        pair. Sampled items without data are replaced by new draws, reading
+        at most 2 * `seed_rows` rows; if none of them has data, the exact
+        scan is used instead.
+        """
+        rng = np.random.default_rng(self.random_state)
+        sample, block = [], []
+        self.seed_reads = 0
+        for i in rng.permutation(self.N)[: 2 * self.seed_rows]:
+            row = self._row(i)
+            self.seed_reads += 1
+            if not np.isnan(row).all():
+                sample.append(i)
+                block.append(row)
+            if len(sample) == self.seed_rows:
+                break
+
+        if not sample:
+            row_mx = self._extrema(backend)[0]
+            self.seed_reads += self.N
+            ind1, ind2 = _seed_pair(row_mx)
+            return ind1, ind2, row_mx[ind1]
+
+        block = np.stack(block)
+        best = np.nanargmax(backend.extrema(block)[0])
+        a, b = sample[best], np.nanargmax(block[best])
+        value = block[best, b]
+
+        for _ in range(self.seed_passes):
+            row = self._row(b)
+            self.seed_reads += 1
+            c = np.nanargmax(row)
+            if not row[c] > value:
+                break
+            a, b, value = b, c, row[c]
+
+        return min(a, b), max(a, b), value
+
+    def _extrema(self, backend):
+        """
+        Row-wise maximum, minimum and NaN count of the whole matrix.
+        """
+        if isinstance(self.matrix, SparseMatrix):
+            return self.matrix.extrema()
+        extrema = [
+            backend.extrema(self._rows(start, start + self._chunk_size))
+            for start in range(0, self.N, self._chunk_size)
+        ]
+        return tuple(np.concatenate(x) for x in zip(*extrema))
+
+    def _rows(self, start, stop):
+        """
+        Read matrix rows [start, stop) as a float array.
+
+        Rows of multiple matrices are combined block by block in the
+        objective's transformed space, so no combined matrix is built.
+        """
+        if isinstance(self.matrix, list):
+            return self._fuse(lambda x: utils.read_rows(x, start, stop))
+        return utils.read_rows(self.matrix, start, stop)
+
+    def _row(self, i):
+        """
+        Read matrix row i as a float array.
+        """
+        return self._rows(i, i + 1)[0]
+
+    def _prune(self, active, score, remaining, upper, lower):
+        """
+        Drop active candidates that cannot be chosen in the remaining steps.
+
+        Over the next r steps a candidate's log-sum (or sum) stays within
+        [score + r * lower, score + r * upper], and a running minimum within
+        [min(score, lower), score]. At step r at most r candidates have been
+        removed, so candidate j can never win if its highest possible value
+        is below the `remaining`-th largest lowest possible value of the
+        other candidates.
+        """
+        values = score[active]
+        valid = ~np.isnan(values)
+        if np.count_nonzero(valid) <= remaining:
+            return active[valid]
 
-        for i in range(self.n - 2):
-            logsum += np.log(disarray[-1])
-            indn = np.nanargmax(logsum)
-            indices.append(indn)
-            disarray.append(np.array(self.matrix.loc[indn]))
+        r = remaining - 1
+        ub, lb = values, values
+        if r and self.objective == "maxmin":
+            lb = np.minimum(values, lower[active])
+        elif r:
+            with np.errstate(invalid="ignore"):
+                ub = values + np.maximum(0, r * upper[active])
+                lb = values + np.minimum(0, r * lower[active])
 
-        self.res = pd.DataFrame([indices], index=["matrix index"]).T
+        floor = np.partition(lb[valid], -remaining)[-remaining]
+        # Allow for rounding in the accumulated sums
+        tol = 1e-9 * remaining * (1 + np.abs(floor))
+        hopeless = valid & (ub < floor - tol)
+        return active[valid & ~hopeless]
 
     def post_process(self):
         """
         Add ranking numbers to ordered rank from search.
         """
-        narray = np.array([x for x in range(1, self.n + 1)])
-        res = self.res
-        res["n Dissimilar"] = narray
-        self.res = res
+        self.ranks = np.arange(1, self.n + 1)
+        self._res = None
 
     def benchmark(self):
         """
-        Calculate summed dissimilarity.
+        Calculate objective (by default summed log dissimilarity).
         """
-        idx = self.res["matrix index"].values
-        self.matrix.columns = self.matrix.columns.astype(int)
-        submatrix = self.matrix[idx].loc[idx]
-        submatrix = submatrix.applymap(log)
-        final_sum = submatrix.sum().sum() / 2
-        self.final_sum = final_sum
+        objective = self._kernel()
+        if isinstance(self.matrix, list):
+            submatrix = self._fuse(lambda x: utils.submatrix(x, self.indices))
+        else:
+            submatrix = utils.submatrix(self.matrix, self.indices)
+        self.final_sum = _scorers[objective](submatrix)
 
     def save(self, path, obj):
         """
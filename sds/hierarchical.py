@@ -0,0 +1,212 @@
+from concurrent.futures import ThreadPoolExecutor
+from sds import downselect, utils
+import numpy as np
+
+
+def HierarchicalSDS(matrix, n, **kwargs):
+    return HierarchicalSDSWrapper(**kwargs).run(matrix, n)
+
+
+class HierarchicalSDSWrapper:
+    """
+    Two-stage (divide-and-conquer) Similarity Down Selection.
+
+    The population is split into partitions, SDS is run independently on
+    each partition's block of the matrix, and a final SDS is run over the
+    union of the partition winners. Only the diagonal blocks of the full
+    matrix (and the block spanning the union of winners) are ever built, so
+    populations too large for a single matrix can be downselected.
+
+    Attributes
+    ----------
+    n : int
+        Set size of most dissilimar elements to return from population.
+    matrix : :obj:`~pd.DataFrame`, :obj:`~np.ndarray` or callable
+        Either a Pandas DataFrame or numpy array of NxN dimension (see
+        :obj:`~sds.downselect.SDSWrapper`), or a callable ``f(rows, cols)``
+        taking two integer index arrays and returning the corresponding
+        ``len(rows)`` x ``len(cols)`` block of pairwise dissimilarities.
+        Diagonal (self) entries of callable blocks are set to np.nan.
+    N : int
+        Full population size. Must be passed alongside a callable matrix.
+    partitions : int
+        Number of partitions the population is split into.
+    n_partition : int
+        Set size selected within each partition. Defaults to n. Together the
+        partitions must be able to supply n items (n_partition * partitions
+        >= n). Partitions with fewer than two items that have data select
+        nothing.
+    n_jobs : int
+        Number of partitions searched concurrently.
+    shuffle : bool
+        Randomly assign items to partitions instead of contiguous ranges.
+    random_state : int
+        Seed used when shuffle is True.
+    compare : bool
+        Also run a plain single-matrix SDS and report its objective as
+        plain_sum. Requires the full NxN matrix to be feasible.
+    objective : str
+        Diversity objective used in both stages (see
+        :obj:`~sds.downselect.SDSWrapper`).
+    partition_res : list of :obj:`~np.ndarray`
+        Population indices selected within each partition.
+    indices : :obj:`~np.ndarray`
+        Resultant population indices for the n most dissimilar elements,
+        ranked from 1st most dissimilar.
+    res : :obj:`~pd.DataFrame`
+        Resultant Pandas DataFrame of `indices`, built on first access.
+    final_sum : float
+        Objective value of the hierarchical result.
+    plain_sum : float
+        Objective value of a plain SDS run, if compare is True.
+    """
+
+    _defaults = [
+        "n",
+        "matrix",
+        "N",
+        "partitions",
+        "n_partition",
+        "n_jobs",
+        "shuffle",
+        "random_state",
+        "compare",
+        "objective",
+    ]
+    _default_value = [3, None, None, 2, None, 1, False, None, False, "logsum"]
+    _res = None
+    ranks = None
+
+    def __init__(self, **kwargs):
+        """
+        Initialize :obj:`~sds.hierarchical.HierarchicalSDSWrapper` instance.
+        """
+        self.__dict__.update(dict(zip(self._defaults, self._default_value)))
+        self.__dict__.update(**kwargs)
+
+    def set_matrix(self, matrix, N=None):
+        """
+        Set matrix (or distance callable) and dimension attributes.
+        """
+        if callable(matrix):
+            if N is None:
+                raise ValueError("N must be provided with a callable matrix.")
+            self.matrix = matrix
+            self.N = int(N)
+        else:
+            self.matrix = downselect.SDSWrapper()._check_matrix(matrix)
+            self.N = len(self.matrix)
+
+    def _block(self, idx):
+        """
+        Build the square block of the matrix spanned by population indices.
+        """
+        if callable(self.matrix):
+            block = np.array(self.matrix(idx, idx), dtype=float)
+            np.fill_diagonal(block, np.nan)
+        else:
+            block = utils.submatrix(self.matrix, idx)
+        return block
+
+    def split(self):
+        """
+        Partition population indices into `partitions` groups.
+        """
+        idx = np.arange(self.N)
+        if self.shuffle:
+            idx = np.random.default_rng(self.random_state).permutation(idx)
+        groups = [np.sort(x) for x in np.array_split(idx, self.partitions)]
+        if min(len(x) for x in groups) < 2:
+            raise ValueError("Each partition must contain at least two items.")
+        return groups
+
+    def _search_block(self, idx, n):
+        """
+        Run SDS over the block spanned by idx, returning population indices.
+
+        Blocks with fewer than two items that have data cannot seed a pair
+        and select nothing.
+        """
+        sub = downselect.SDSWrapper(objective=self.objective)
+        sub.set_matrix(self._block(idx))
+        sub.set_n(n)
+        if sub.n < 2:
+            sub.n = 0
+            sub.indices = np.empty(0, dtype=int)
+            return sub, idx[sub.indices]
+        sub.search()
+        return sub, idx[sub.indices]
+
+    def search(self):
+        """
+        Execute two-stage similarity down selection.
+        """
+        if self.matrix is None:
+            raise ValueError("Matrix must be set prior to search.")
+        n_partition = self.n if self.n_partition is None else self.n_partition
+        if n_partition * self.partitions < self.n:
+            raise ValueError(
+                "n_partition * partitions must be at least n ({} * {} < {}).".format(
+                    n_partition, self.partitions, self.n
+                )
+            )
+
+        groups = self.split()
+        with ThreadPoolExecutor(max_workers=self.n_jobs) as pool:
+            self.partition_res = list(
+                pool.map(lambda x: self._search_block(x, n_partition)[1], groups)
+            )
+
+        # Final down selection over the union of partition winners
+        union = np.sort(np.concatenate(self.partition_res))
+        final, indices = self._search_block(union, self.n)
+        final.post_process()
+        final.benchmark()
+        self.n = final.n
+        self.final_sum = final.final_sum
+        self.indices = indices
+        self.ranks = None
+        self._res = None
+
+    @property
+    def res(self):
+        """
+        Resultant Pandas DataFrame of ranked population indices.
+        """
+        if self._res is None:
+            self._res = utils.ranking(self.indices, self.ranks)
+        return self._res
+
+    @res.setter
+    def res(self, res):
+        self._res = res
+
+    def post_process(self):
+        """
+        Add ranking numbers to ordered rank from search.
+        """
+        self.ranks = np.arange(1, self.n + 1)
+        self._res = None
+
+    def benchmark(self):
+        """
+        Calculate objective of a plain SDS run for comparison.
+        """
+        if not self.compare:
+            return
+        full = self.matrix
+        if callable(full):
+            full = self._block(np.arange(self.N))
+        plain = downselect.SDS(full, self.n, objective=self.objective)
+        self.plain_sum = plain.final_sum
+
+    def run(self, matrix, n, N=None):
+        """
+        Helper function to streamline execution of key functions.
+        """
+        self.set_matrix(matrix, N=N)
+        self.n = n
+        self.search()
+        self.post_process()
+        self.benchmark()
+        return self
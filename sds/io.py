@@ -1,4 +1,5 @@
-import pandas as pd
+from sds import utils
+from sds.sparse import SparseMatrix
 import numpy as np
 import os
 import pickle
@@ -19,10 +20,12 @@ def load_csv(path):
         Pandas DataFrame of NxN matrix.
 
     """
+    import pandas as pd
+
     return pd.read_csv(path)
 
 
-def load_numpy(path, key="arr_0"):
+def load_numpy(path, key="arr_0", frame=True):
     """
     Load numpy file (.npz).
 
@@ -32,20 +35,52 @@ def load_numpy(path, key="arr_0"):
         Path to .npz.
     key : str
         Accession key of .npz, default is arr_0.
+    frame : bool
+        Return a Pandas DataFrame (default), or the plain numpy array.
 
     Returns
     -------
-    data, :obj:`~pd.DataFrame`
-        Pandas DataFrame of NxN matrix.
+    data, :obj:`~pd.DataFrame`, :obj:`~np.ndarray` or :obj:`~sds.sparse.SparseMatrix`
+        Pandas DataFrame (or numpy array) of NxN matrix. Files saved from a
+        :obj:`~sds.sparse.SparseMatrix` are loaded as such.
 
     """
-    npz = np.load(path)[key]
+    npz = np.load(path)
+    if "indptr" in npz.files:
+        return SparseMatrix(npz["indptr"], npz["indices"], npz["data"])
+    npz = npz[key]
+    if not frame:
+        return npz
+
+    import pandas as pd
+
     df = pd.DataFrame.from_dict(
         {elem: item for elem, item in enumerate(npz)}, orient="index"
     )
     return df
 
 
+def load_npy(path, mmap_mode=None):
+    """
+    Load numpy array file (.npy) without pandas.
+
+    Parameters
+    ----------
+    path : str
+        Path to .npy.
+    mmap_mode : str
+        If given (e.g., "r"), memory-map the array instead of reading it
+        into memory. See :func:`numpy.load`.
+
+    Returns
+    -------
+    data, :obj:`~np.ndarray`
+        Numpy array (or memory map) of NxN matrix.
+
+    """
+    return np.load(path, mmap_mode=mmap_mode)
+
+
 def load_pickle(path):
     """
     Load pickled file.
@@ -61,6 +96,8 @@ def load_pickle(path):
         Pandas DataFrame of NxN matrix.
 
     """
+    import pandas as pd
+
     # Load file
     with open(path, "rb") as f:
         return pd.read_pickle(f)
@@ -81,6 +118,8 @@ def load_tsv(path):
         Pandas DataFrame of NxN matrix.
 
     """
+    import pandas as pd
+
     return pd.read_csv(path, sep="\t")
 
 
@@ -91,12 +130,13 @@ def load(path):
     Parameters
     ----------
     path : str
-        Path to file containing object. Supported extensions include .pkl, .csv, .tsv, .npz
+        Path to file containing object. Supported extensions include .pkl, .csv, .tsv,
+        .npz, .npy
 
     Returns
     -------
     data, :obj:`~pd.DataFrame`
-        Data object (e.g., Pandas DataFrame of SDS class).
+        Data object (e.g., Pandas DataFrame, numpy array or SDS class).
 
     """
     if (type(path)) == str:
@@ -106,6 +146,8 @@ def load(path):
         return load_pickle(path)
     if extension == ".npz":
         return load_numpy(path)
+    if extension == ".npy":
+        return load_npy(path)
     if extension == ".csv":
         return load_csv(path)
     if extension == ".tsv":
@@ -124,25 +166,47 @@ def save_csv(path, obj):
     obj, :obj:`~pd.DataFrame`
         Matrix object as Pandas DataFrame.
     """
-    if not isinstance(obj, pd.DataFrame):
+    if not utils.is_dataframe(obj):
         raise ValueError("object is not a valid Pandas DataFrame")
     obj.to_csv(path, index=False)
 
 
 def save_numpy(path, obj):
     """
-    Save Pandas DataFrame as compressed numpy.
+    Save Pandas DataFrame, numpy array or sparse matrix as compressed numpy.
 
     Parameters
     ----------
     path : str
         Path to output file.
-    obj, :obj:`~pd.DataFrame`
-        Matrix object as Pandas DataFrame.
+    obj, :obj:`~pd.DataFrame`, :obj:`~np.ndarray` or :obj:`~sds.sparse.SparseMatrix`
+        Matrix object. Sparse matrices are stored as their CSR arrays.
     """
-    if not isinstance(obj, pd.DataFrame):
-        raise ValueError("object is not a valid Pandas DataFrame")
-    np.savez(path, obj.to_numpy())
+    if isinstance(obj, SparseMatrix):
+        return np.savez(path, indptr=obj.indptr, indices=obj.indices, data=obj.data)
+    if utils.is_dataframe(obj):
+        obj = obj.to_numpy()
+    if not isinstance(obj, np.ndarray):
+        raise ValueError("object is not a valid Pandas DataFrame or numpy array")
+    np.savez(path, obj)
+
+
+def save_npy(path, obj):
+    """
+    Save Pandas DataFrame or numpy array as numpy array file.
+
+    Parameters
+    ----------
+    path : str
+        Path to output file.
+    obj, :obj:`~pd.DataFrame` or :obj:`~np.ndarray`
+        Matrix object as Pandas DataFrame or numpy array.
+    """
+    if utils.is_dataframe(obj):
+        obj = obj.to_numpy()
+    if not isinstance(obj, np.ndarray):
+        raise ValueError("object is not a valid Pandas DataFrame or numpy array")
+    np.save(path, obj)
 
 
 def save_pickle(path, obj):
@@ -173,7 +237,7 @@ def save_tsv(path, obj):
     obj, :obj:`~pd.DataFrame`
         Matrix object as Pandas DataFrame.
     """
-    if not isinstance(obj, pd.DataFrame):
+    if not utils.is_dataframe(obj):
         raise ValueError("object is not a valid Pandas DataFrame")
     obj.to_csv(path, index=False, sep="\t")
 
@@ -185,7 +249,8 @@ def save(path, obj):
     Parameters
     ----------
     path : str
-        Path to save file. Supported extensions include .pkl, .csv, .tsv, .npz
+        Path to save file. Supported extensions include .pkl, .csv, .tsv, .npz,
+        .npy
     obj, :obj:`~pd.DataFrame` or `~sds.downselect.SDS`
         Arbitrary object instance.
     """
@@ -198,6 +263,8 @@ def save(path, obj):
         return save_tsv(path, obj)
     if extension == ".npz":
         return save_numpy(path, obj)
+    if extension == ".npy":
+        return save_npy(path, obj)
     if extension == ".pkl":
         return save_pickle(path, obj)
     raise IOError("Extension {} not recognized.".format(extension))
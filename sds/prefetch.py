@@ -0,0 +1,114 @@
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+
+def top_candidates(score, k, active=None):
+    """
+    Indices of the (up to) k highest scoring candidates, ignoring np.nan.
+
+    Parameters
+    ----------
+    score : :obj:`~np.ndarray`
+        Running score of every candidate.
+    k : int
+        Number of candidates to return.
+    active : :obj:`~np.ndarray`
+        Indices of candidates to consider. All candidates if None.
+
+    Returns
+    -------
+    indices : :obj:`~np.ndarray`
+        Candidate indices, in no particular order.
+
+    """
+    values = score if active is None else score[active]
+    values = np.where(np.isnan(values), -np.inf, values)
+    k = min(k, len(values))
+    if k <= 0:
+        return np.empty(0, dtype=int)
+    top = np.argpartition(values, -k)[-k:]
+    top = top[values[top] > -np.inf]
+    return top if active is None else active[top]
+
+
+class RowPrefetcher:
+    """
+    Bounded row cache filled speculatively by background reads.
+
+    Rows requested through :meth:`prefetch` are read on worker threads while
+    the caller keeps computing; :meth:`get` returns a cached (or in-flight)
+    row as a hit, or reads it synchronously as a miss. Overlapping reads with
+    compute hides the latency of matrices on slow storage (e.g., memory maps
+    on network or spinning disks).
+
+    Attributes
+    ----------
+    read : callable
+        Function reading matrix row i. Prefetched rows are copied on the
+        worker thread, so views (e.g., of memory maps) are fully read there.
+    cache_size : int
+        Maximum number of rows held (or in flight) at once. Least recently
+        requested rows are evicted first.
+    hits : int
+        Rows served from the cache.
+    misses : int
+        Rows read synchronously.
+    """
+
+    def __init__(self, read, cache_size=64, workers=2):
+        """
+        Initialize :obj:`~sds.prefetch.RowPrefetcher` instance.
+        """
+        self.read = read
+        self.cache_size = cache_size
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+        self._pool = ThreadPoolExecutor(max_workers=workers)
+
+    def prefetch(self, indices):
+        """
+        Schedule background reads of rows not already cached.
+        """
+        for i in indices:
+            i = int(i)
+            if i in self._cache:
+                self._cache.move_to_end(i)
+                continue
+            self._cache[i] = self._pool.submit(self._load, i)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)[1].cancel()
+
+    def _load(self, i):
+        """
+        Read row i into memory owned by the cache.
+
+        Reading a memory map only returns a view, so the row is copied here
+        to fault its pages in on the worker thread rather than the caller's.
+        """
+        return np.array(self.read(i), copy=True)
+
+    def get(self, i):
+        """
+        Return row i, from the cache when possible.
+        """
+        future = self._cache.pop(int(i), None)
+        if future is None:
+            self.misses += 1
+            return self.read(i)
+        self.hits += 1
+        return future.result()
+
+    def close(self):
+        """
+        Drop cached rows and stop worker threads.
+        """
+        self._cache.clear()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -0,0 +1,158 @@
+import numpy as np
+
+
+class SparseMatrix:
+    """
+    Square dissimilarity matrix storing only known pairs, row by row (CSR).
+
+    Row i holds the column indices ``indices[indptr[i]:indptr[i + 1]]`` and
+    the matching dissimilarities ``data[indptr[i]:indptr[i + 1]]``. Absent
+    entries, including the diagonal, are np.nan, with the same missing-data
+    semantics as a dense matrix (see :obj:`~sds.downselect.SDSWrapper`).
+    Memory and scan time scale with the number of known pairs rather than N².
+
+    Attributes
+    ----------
+    indptr : :obj:`~np.ndarray`
+        Row pointer array of length N + 1.
+    indices : :obj:`~np.ndarray`
+        Column index of each known entry.
+    data : :obj:`~np.ndarray`
+        Dissimilarity of each known entry.
+    N : int
+        Dimension of matrix object and full population size.
+    """
+
+    def __init__(self, indptr, indices, data):
+        """
+        Initialize :obj:`~sds.sparse.SparseMatrix` instance.
+        """
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.data = np.asarray(data, dtype=float)
+        self.N = len(self.indptr) - 1
+        if len(self.indices) != len(self.data) or self.indptr[-1] != len(self.data):
+            raise ValueError("Inconsistent sparse matrix arrays")
+        if self.indptr[0] != 0 or np.any(np.diff(self.indptr) < 0):
+            raise ValueError("Sparse matrix row pointers must increase from 0")
+        if np.any(self.indices < 0) or np.any(self.indices >= self.N):
+            raise ValueError("Sparse matrix column indices out of range")
+
+        # Row NaN counts (and so n and pruning bounds) assume each known
+        # entry is stored once, off the diagonal
+        rows = np.repeat(np.arange(self.N), np.diff(self.indptr))
+        if np.any(rows == self.indices):
+            raise ValueError("Sparse matrix diagonal entries must be absent")
+        if len(np.unique(rows * self.N + self.indices)) != self.nnz:
+            raise ValueError("Sparse matrix entries must be unique")
+
+    @classmethod
+    def from_dense(cls, x):
+        """
+        Build from a dense NxN array, keeping every non-NaN off-diagonal entry.
+        """
+        x = np.asarray(x, dtype=float)
+        known = ~np.isnan(x)
+        np.fill_diagonal(known, False)
+        indptr = np.concatenate([[0], np.cumsum(known.sum(axis=1))])
+        return cls(indptr, np.nonzero(known)[1], x[known])
+
+    @classmethod
+    def from_pairs(cls, rows, cols, values, N, symmetric=True):
+        """
+        Build from known pairs (e.g., neighbors within a cutoff or a kNN graph).
+
+        Parameters
+        ----------
+        rows, cols : :obj:`~np.ndarray`
+            Item indices of each known pair, in [0, N).
+        values : :obj:`~np.ndarray`
+            Dissimilarity of each known pair. np.nan values and self pairs
+            (i, i) are dropped.
+        N : int
+            Full population size.
+        symmetric : bool
+            Mirror each pair (i, j) to (j, i). Pairs given more than once
+            (including as both (i, j) and (j, i)) keep their first value.
+
+        Returns
+        -------
+        data, :obj:`~sds.sparse.SparseMatrix`
+            Sparse matrix of known pairs.
+
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        cols = np.asarray(cols, dtype=np.int64)
+        values = np.asarray(values, dtype=float)
+        if np.any((rows < 0) | (rows >= N) | (cols < 0) | (cols >= N)):
+            raise ValueError("Pair indices must lie in [0, {})".format(N))
+        known = ~np.isnan(values) & (rows != cols)
+        rows, cols, values = rows[known], cols[known], values[known]
+        if symmetric:
+            # Keep each unordered pair once, then mirror it
+            rows, cols = np.minimum(rows, cols), np.maximum(rows, cols)
+            _, first = np.unique(rows * N + cols, return_index=True)
+            rows, cols, values = rows[first], cols[first], values[first]
+            rows, cols = np.concatenate([rows, cols]), np.concatenate([cols, rows])
+            values = np.concatenate([values, values])
+
+        # Sort row by row, keeping the first of any repeated pair
+        _, first = np.unique(rows * N + cols, return_index=True)
+        rows, cols, values = rows[first], cols[first], values[first]
+        indptr = np.concatenate([[0], np.cumsum(np.bincount(rows, minlength=N))])
+        return cls(indptr, cols, values)
+
+    @property
+    def shape(self):
+        return (self.N, self.N)
+
+    @property
+    def nnz(self):
+        return len(self.data)
+
+    def __len__(self):
+        return self.N
+
+    def rows(self, start, stop):
+        """
+        Dense rows [start, stop) with absent entries as np.nan.
+        """
+        stop = min(stop, self.N)
+        block = np.full((stop - start, self.N), np.nan)
+        lo, hi = self.indptr[start], self.indptr[stop]
+        counts = np.diff(self.indptr[start : stop + 1])
+        rows = np.repeat(np.arange(stop - start), counts)
+        block[rows, self.indices[lo:hi]] = self.data[lo:hi]
+        return block
+
+    def row(self, i):
+        """
+        Dense row i with absent entries as np.nan.
+        """
+        return self.rows(i, i + 1)[0]
+
+    def extrema(self):
+        """
+        Row-wise maximum, minimum and NaN count over known entries only.
+        """
+        counts = np.diff(self.indptr)
+        known = counts > 0
+        rowmax = np.full(self.N, np.nan)
+        rowmin = np.full(self.N, np.nan)
+        if self.nnz:
+            starts = self.indptr[:-1][known]
+            rowmax[known] = np.maximum.reduceat(self.data, starts)
+            rowmin[known] = np.minimum.reduceat(self.data, starts)
+        return rowmax, rowmin, self.N - counts
+
+    def submatrix(self, idx):
+        """
+        Dense block spanned by row (and column) indices.
+        """
+        return np.stack([self.row(i)[idx] for i in idx])
+
+    def todense(self):
+        """
+        Dense NxN array with absent entries as np.nan.
+        """
+        return self.rows(0, self.N)
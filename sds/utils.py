@@ -1,4 +1,24 @@
-import pandas as pd
+from sds.sparse import SparseMatrix
+import sys
+import numpy as np
+
+
+def is_dataframe(x):
+    """
+    Check whether object is a Pandas DataFrame without importing pandas.
+
+    Parameters
+    ----------
+    x : any
+        Object to check.
+    Returns
+    -------
+    result : bool
+        True if x is a Pandas DataFrame.
+
+    """
+    pd = sys.modules.get("pandas")
+    return pd is not None and isinstance(x, pd.DataFrame)
 
 
 def safematrix(x):
@@ -11,14 +31,92 @@ def safematrix(x):
         Object to be cast as matrix.
     Returns
     -------
-    data, :obj:`~pd.DataFrame`
-        Input safely cast to Pandas DataFrame.
+    data, :obj:`~pd.DataFrame`, :obj:`~np.ndarray` or :obj:`~sds.sparse.SparseMatrix`
+        Input safely cast to Pandas DataFrame (copied), or numpy array or
+        sparse matrix (not copied, so memory-mapped arrays stay on disk).
 
     """
 
-    if not isinstance(x, (pd.DataFrame)):
-        raise ValueError("Matrix object is not a valid Pandas DataFrame")
-    if isinstance(x, pd.DataFrame):
+    if is_dataframe(x):
         N = len(x.index)
         assert N == len(x.columns)
-    return x.copy()
+        return x.copy()
+    if isinstance(x, np.ndarray):
+        if x.ndim != 2 or x.shape[0] != x.shape[1]:
+            raise ValueError("Matrix object is not a square array")
+        return x
+    if isinstance(x, SparseMatrix):
+        return x
+    raise ValueError(
+        "Matrix object is not a valid Pandas DataFrame, numpy array or sparse matrix"
+    )
+
+
+def read_rows(x, start, stop):
+    """
+    Read a contiguous block of matrix rows.
+
+    Parameters
+    ----------
+    x : :obj:`~pd.DataFrame`, :obj:`~np.ndarray` or :obj:`~sds.sparse.SparseMatrix`
+        NxN matrix.
+    start, stop : int
+        Row range [start, stop).
+    Returns
+    -------
+    data, :obj:`~np.ndarray`
+        Float array of the selected rows, absent entries as np.nan.
+
+    """
+    if isinstance(x, SparseMatrix):
+        return x.rows(start, stop)
+    if is_dataframe(x):
+        return x.iloc[start:stop].to_numpy(dtype=float)
+    return np.asarray(x[start:stop], dtype=float)
+
+
+def submatrix(x, idx):
+    """
+    Extract the square block of a matrix spanned by row (and column) indices.
+
+    Parameters
+    ----------
+    x : :obj:`~pd.DataFrame`, :obj:`~np.ndarray` or :obj:`~sds.sparse.SparseMatrix`
+        NxN matrix.
+    idx : :obj:`~np.ndarray`
+        Integer positions of the rows (and columns) to extract.
+    Returns
+    -------
+    data, :obj:`~np.ndarray`
+        Float array of the selected block.
+
+    """
+    if is_dataframe(x):
+        return x.iloc[idx, idx].to_numpy(dtype=float)
+    if isinstance(x, SparseMatrix):
+        return x.submatrix(idx)
+    return np.asarray(x[np.ix_(idx, idx)], dtype=float)
+
+
+def ranking(indices, ranks=None):
+    """
+    Build result DataFrame of ranked matrix indices. Imports pandas.
+
+    Parameters
+    ----------
+    indices : :obj:`~np.ndarray`
+        Matrix indices, ranked from 1st most dissimilar.
+    ranks : :obj:`~np.ndarray`
+        Optional rank numbers, added as column "n Dissimilar".
+    Returns
+    -------
+    data, :obj:`~pd.DataFrame`
+        Pandas DataFrame with column "matrix index".
+
+    """
+    import pandas as pd
+
+    res = pd.DataFrame([indices], index=["matrix index"]).T
+    if ranks is not None:
+        res["n Dissimilar"] = ranks
+    return res
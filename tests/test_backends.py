@@ -0,0 +1,98 @@
+import sds
+import pytest
+import numpy as np
+import pandas as pd
+from sds.backends import NumpyBackend
+
+from tests import localfile
+
+
+@pytest.fixture
+def matrix():
+    return pd.read_csv(localfile("resources/toy-data.csv"))
+
+
+@pytest.fixture
+def block():
+    values = np.random.default_rng(0).random((30, 30))
+    values[np.random.default_rng(1).random((30, 30)) < 0.1] = np.nan
+    values[4] = np.nan
+    values[7, 3] = 0
+    return values
+
+
+@pytest.fixture(params=sds.backends.available())
+def backend(request):
+    return sds.backends.get_backend(request.param)
+
+
+def test_available():
+    # Default backend is always available
+    assert "numpy" in sds.backends.available()
+
+
+def test_get_backend():
+    # Check numpy is the default
+    assert sds.backends.get_backend().name == "numpy"
+
+    # Check auto detection returns the preferred backend
+    assert sds.backends.get_backend("auto").name == sds.backends.available()[0]
+
+    # Check instances pass through
+    backend = NumpyBackend()
+    assert sds.backends.get_backend(backend) is backend
+
+    with pytest.raises(ValueError):
+        sds.backends.get_backend("fortran")
+
+
+def test_check_objective():
+    with pytest.raises(ValueError):
+        sds.backends.check_objective("median")
+
+
+class TestConformance:
+    def test_extrema(self, backend, block):
+        # Compare against the reference implementation
+        for x, expected in zip(backend.extrema(block), NumpyBackend().extrema(block)):
+            np.testing.assert_array_equal(x, expected)
+
+        # Check against NaN-aware numpy reductions
+        rowmax, rowmin, count = backend.extrema(block)
+        with pytest.warns(RuntimeWarning):
+            np.testing.assert_array_equal(rowmax, np.nanmax(block, axis=1))
+        np.testing.assert_array_equal(count, np.isnan(block).sum(axis=1))
+
+    @pytest.mark.parametrize("objective", ["logsum", "sum", "maxmin"])
+    @pytest.mark.parametrize("use_active", [False, True])
+    def test_update(self, backend, block, objective, use_active):
+        reference = NumpyBackend()
+        score = backend.init(len(block), objective)
+        expected = reference.init(len(block), objective)
+        active = np.arange(0, len(block), 2) if use_active else None
+
+        for row in block[:4]:
+            index = backend.update(score, row, objective, active)
+            expected_index = reference.update(expected, row, objective, active)
+
+            # Check chosen candidate and accumulated score agree
+            assert index == expected_index
+            np.testing.assert_allclose(score, expected)
+
+    def test_update_all_nan(self, backend):
+        score = backend.init(3, "sum")
+
+        # Check no candidate is reported
+        assert backend.update(score, np.full(3, np.nan), "sum") == -1
+        assert backend.update(score, np.ones(3), "sum", np.array([0, 2])) == -1
+
+    @pytest.mark.parametrize("objective", ["logsum", "sum", "maxmin"])
+    @pytest.mark.parametrize("prune", [False, True])
+    def test_search(self, backend, matrix, objective, prune):
+        testSDS = sds.downselect.SDS(
+            matrix, 10, objective=objective, prune=prune, backend=backend
+        )
+        expected = sds.downselect.SDS(matrix, 10, objective=objective, backend="numpy")
+
+        # Check ranking matches the reference backend
+        pd.testing.assert_frame_equal(testSDS.res, expected.res)
@@ -1,5 +1,6 @@
 import sds
 import pytest
+import numpy as np
 import pandas as pd
 from sds.downselect import SDSWrapper
 
@@ -78,6 +79,20 @@ class TestSDSWrapper:
 
         assert isinstance(SDS.res, pd.DataFrame)
 
+    def test_search_array(self, SDS, matrix):
+        # Set matrix as plain numpy array
+        SDS.set_matrix(matrix.to_numpy())
+        SDS.set_n(10)
+
+        # Run search algorithm
+        SDS.search()
+
+        # Check plain array result matches DataFrame input
+        expected = sds.downselect.SDS(matrix, 10)
+        assert isinstance(SDS.indices, np.ndarray)
+        np.testing.assert_array_equal(SDS.indices, expected.indices)
+        np.testing.assert_array_equal(SDS.res["matrix index"], expected.indices)
+
     def test_post_process(self, SDS, matrix):
         # Set matrix
         SDS.set_matrix(matrix)
@@ -105,6 +120,249 @@ class TestSDSWrapper:
 
         assert isinstance(SDS.final_sum, float)
 
+    @pytest.mark.parametrize("x", [3, 10, 20])
+    def test_search_prune(self, SDS, matrix, x):
+        # Unpruned reference ranking
+        expected = sds.downselect.SDS(matrix, x)
+
+        # Set matrix with pruning enabled
+        SDS.prune = True
+        SDS.set_matrix(matrix)
+        SDS.set_n(x)
+
+        # Run search algorithm
+        SDS.search()
+
+        # Check ranking matches unpruned engine exactly
+        pd.testing.assert_series_equal(
+            SDS.res["matrix index"], expected.res["matrix index"]
+        )
+
+        # Check pruned fraction is reported
+        assert 0 <= SDS.pruned_fraction < 1
+
+    @pytest.mark.parametrize("objective", ["logsum", "sum", "maxmin"])
+    def test_objective(self, matrix, objective):
+        testSDS = sds.downselect.SDS(matrix, 6, objective=objective)
+        values = matrix.to_numpy(dtype=float)
+        idx = testSDS.res["matrix index"].values
+        submatrix = values[np.ix_(idx, idx)]
+        pairs = submatrix[np.triu_indices(6, 1)]
+
+        # Check scorer matches a direct evaluation over selected pairs
+        expected = {
+            "logsum": np.log(pairs).sum(),
+            "sum": pairs.sum(),
+            "maxmin": pairs.min(),
+        }[objective]
+        assert testSDS.final_sum == pytest.approx(expected)
+
+        # Check pruned search agrees for every objective
+        pruned = sds.downselect.SDS(matrix, 6, objective=objective, prune=True)
+        pd.testing.assert_frame_equal(pruned.res, testSDS.res)
+
+    def test_objective_maxmin(self, matrix):
+        testSDS = sds.downselect.SDS(matrix, 5, objective="maxmin")
+        values = matrix.to_numpy(dtype=float)
+        idx = list(testSDS.res["matrix index"].values)
+
+        # Check each pick is the farthest point from those already chosen
+        for k in range(2, 5):
+            nearest = np.min(values[idx[:k]], axis=0)
+            nearest[idx[:k]] = np.nan
+            assert idx[k] == np.nanargmax(nearest)
+
+    def test_objective_invalid(self, SDS, matrix):
+        SDS.objective = "median"
+        SDS.set_matrix(matrix)
+        with pytest.raises(ValueError):
+            SDS.search()
+
+    @pytest.mark.parametrize("objective", ["logsum", "sum", "maxmin"])
+    @pytest.mark.parametrize("prune", [False, True])
+    def test_multi_metric(self, matrix, objective, prune):
+        first = matrix.to_numpy(dtype=float)
+        second = np.sqrt(first) + first.T**2
+        weights = [1.0, 0.5]
+
+        testSDS = sds.downselect.SDS(
+            [matrix, second], 8, weights=weights, objective=objective, prune=prune
+        )
+
+        # Reference run over an explicitly combined matrix
+        if objective == "logsum":
+            combined = first ** weights[0] * second ** weights[1]
+        else:
+            combined = weights[0] * first + weights[1] * second
+        expected = sds.downselect.SDS(combined, 8, objective=objective)
+
+        # Check fused search matches the combined matrix
+        np.testing.assert_array_equal(testSDS.indices, expected.indices)
+        assert testSDS.final_sum == pytest.approx(expected.final_sum)
+
+    def test_multi_metric_single(self, matrix):
+        testSDS = sds.downselect.SDS([matrix], 10)
+        expected = sds.downselect.SDS(matrix, 10)
+
+        # Check a single matrix list matches a plain run
+        np.testing.assert_array_equal(testSDS.indices, expected.indices)
+        assert testSDS.final_sum == pytest.approx(expected.final_sum)
+
+    def test_multi_metric_invalid(self, SDS, matrix):
+        # Check mismatched dimensions are rejected
+        with pytest.raises(ValueError):
+            SDS.set_matrix([matrix, matrix.to_numpy()[:10, :10]])
+
+        # Check weights must match the number of matrices
+        SDS.weights = [1.0]
+        SDS.set_matrix([matrix, matrix])
+        with pytest.raises(ValueError):
+            SDS.set_n(5)
+
+        # Check all-zero weights are rejected
+        with pytest.raises(ValueError):
+            sds.downselect.SDS([matrix, matrix], 4, weights=[0, 0])
+
+    def test_seed_sample_all_rows(self, matrix):
+        # Sampling every row recovers the exact seed pair
+        testSDS = sds.downselect.SDS(
+            matrix, 10, seed="sample", seed_rows=20, check_seed=True
+        )
+        expected = sds.downselect.SDS(matrix, 10)
+
+        np.testing.assert_array_equal(testSDS.indices, expected.indices)
+        assert testSDS.seed_gap == 0
+
+    def test_seed_sample(self):
+        # Euclidean distances between random points
+        points = np.random.default_rng(0).random((300, 3))
+        values = np.linalg.norm(points[:, None] - points[None], axis=-1)
+        np.fill_diagonal(values, np.nan)
+
+        reads = []
+        testSDS = sds.downselect.SDSWrapper(
+            seed="sample", seed_rows=10, seed_passes=3, check_seed=True, random_state=0
+        )
+        testSDS.set_matrix(values)
+        testSDS.set_n(8)
+        testSDS._row = lambda i: reads.append(i) or values[i]
+        testSDS.search()
+
+        # Check row reads are bounded
+        assert testSDS.seed_reads <= 13
+        assert len(reads) == testSDS.seed_reads + 8
+
+        # Check gap to the exact seed is reported
+        assert testSDS.seed_gap >= 0
+        assert len(set(testSDS.indices)) == 8
+
+    @pytest.fixture
+    def missing(self):
+        # Only the first 10 of 50 items have data
+        points = np.random.default_rng(0).random((50, 3))
+        values = np.linalg.norm(points[:, None] - points[None], axis=-1)
+        values[10:] = np.nan
+        values[:, 10:] = np.nan
+        np.fill_diagonal(values, np.nan)
+        return values
+
+    def test_seed_sample_missing_items(self, missing):
+        testSDS = sds.downselect.SDS(missing, 20, seed="sample", random_state=0)
+        expected = sds.downselect.SDS(missing, 20)
+
+        # Check n is reduced to the items with data, as with the exact seed
+        assert testSDS.n == expected.n == 10
+        assert set(testSDS.indices) == set(range(10))
+        assert len(testSDS.res) == 10
+
+    def test_seed_sample_redraw(self, missing):
+        testSDS = sds.downselect.SDS(
+            missing, 5, seed="sample", seed_rows=5, check_seed=True, random_state=0
+        )
+
+        # Check items without data were redrawn within the read budget
+        assert testSDS.seed_reads <= 2 * 5 + testSDS.seed_passes
+        assert set(testSDS.indices) <= set(range(10))
+        assert testSDS.seed_gap >= 0
+
+    def test_seed_sample_fallback(self, missing):
+        # A single sampled row without data falls back to the exact scan
+        values = missing[::-1, ::-1].copy()
+        testSDS = sds.downselect.SDS(
+            values, 5, seed="sample", seed_rows=1, seed_passes=0, random_state=3
+        )
+        expected = sds.downselect.SDS(values, 5)
+
+        # Both sampled rows lacked data, so every row was then scanned
+        assert testSDS.seed_reads == 2 + 50
+        np.testing.assert_array_equal(testSDS.indices, expected.indices)
+
+    @pytest.mark.parametrize("seed", ["exact", "sample"])
+    def test_missing_pairs(self, seed):
+        # Two groups of 10 items without pairs between them
+        points = np.random.default_rng(0).random((20, 3))
+        values = np.linalg.norm(points[:, None] - points[None], axis=-1)
+        values[:10, 10:] = np.nan
+        values[10:, :10] = np.nan
+        np.fill_diagonal(values, np.nan)
+        testSDS = sds.downselect.SDS(values, 15, seed=seed, random_state=0)
+
+        # Check search stops once only one group can be chosen
+        assert testSDS.n == len(testSDS.indices) == 10
+        assert len(set(testSDS.indices // 10)) == 1
+
+    def test_seed_invalid(self, SDS, matrix):
+        SDS.seed = "guess"
+        SDS.set_matrix(matrix)
+        with pytest.raises(ValueError):
+            SDS.search()
+
+    def test_search_prune_large(self):
+        # Euclidean distances between random points
+        points = np.random.default_rng(0).random((200, 3))
+        values = np.linalg.norm(points[:, None] - points[None], axis=-1)
+        np.fill_diagonal(values, np.nan)
+        matrix = pd.DataFrame(values)
+
+        expected = sds.downselect.SDS(matrix, 25)
+        testSDS = sds.downselect.SDS(matrix, 25, prune=True)
+
+        # Check ranking matches unpruned engine exactly
+        pd.testing.assert_frame_equal(testSDS.res, expected.res)
+
+        # Check skipped updates are reported
+        assert 0 <= testSDS.pruned_fraction < 1
+
+    def test_search_prune_work(self):
+        # A few far apart items among many near duplicates
+        rng = np.random.default_rng(0)
+        values = 0.01 * rng.random((1000, 1000))
+        values[:50, :50] = 1 + rng.random((50, 50))
+        values = np.minimum(values, values.T)
+        np.fill_diagonal(values, np.nan)
+
+        class Counting(sds.backends.NumpyBackend):
+            touched = 0
+
+            def update(self, score, row, objective, active=None):
+                self.touched += len(score) if active is None else len(active)
+                return super().update(score, row, objective, active)
+
+        backend = Counting()
+        expected = sds.downselect.SDS(values, 20, objective="sum")
+        testSDS = sds.downselect.SDS(
+            values, 20, objective="sum", prune=True, backend=backend
+        )
+
+        # Check ranking matches unpruned engine exactly
+        np.testing.assert_array_equal(testSDS.indices, expected.indices)
+
+        # Check the loop updated far fewer candidates than N per step
+        full = 1000 * 18
+        touched = backend.touched - 1000
+        assert touched < full / 2
+        assert testSDS.pruned_fraction == pytest.approx(1 - touched / full)
+
     @pytest.mark.parametrize("x,expected", [(3, 3), (20, 20), (21, 20)])
     def test_run(self, SDS, matrix, x, expected):
         # Execute run function
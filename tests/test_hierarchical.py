@@ -0,0 +1,98 @@
+import sds
+import pytest
+import numpy as np
+import pandas as pd
+from sds.hierarchical import HierarchicalSDSWrapper
+
+from tests import localfile
+
+
+@pytest.fixture
+def matrix():
+    return pd.read_csv(localfile("resources/toy-data.csv"))
+
+
+@pytest.fixture
+def distance(matrix):
+    values = matrix.to_numpy(dtype=float)
+    return lambda rows, cols: values[np.ix_(rows, cols)]
+
+
+@pytest.mark.parametrize("partitions,n_jobs", [(2, 1), (4, 2)])
+def test_HierarchicalSDS(matrix, partitions, n_jobs):
+    testSDS = sds.hierarchical.HierarchicalSDS(
+        matrix, 5, partitions=partitions, n_jobs=n_jobs, compare=True
+    )
+
+    # Check class initialization
+    assert isinstance(testSDS, HierarchicalSDSWrapper)
+
+    # Check one result per partition
+    assert len(testSDS.partition_res) == partitions
+
+    # Check unique population indices are returned
+    idx = testSDS.res["matrix index"].values
+    assert len(set(idx)) == 5
+    assert idx.min() >= 0 and idx.max() < len(matrix)
+
+    # Check objectives are reported side by side
+    assert isinstance(testSDS.final_sum, float)
+    assert isinstance(testSDS.plain_sum, float)
+
+
+def test_single_partition(matrix):
+    # A single partition reduces to a plain SDS run
+    testSDS = sds.hierarchical.HierarchicalSDS(matrix, 5, partitions=1)
+    plain = sds.downselect.SDS(matrix, 5)
+
+    np.testing.assert_array_equal(
+        testSDS.res["matrix index"].values, plain.res["matrix index"].values
+    )
+    assert testSDS.final_sum == pytest.approx(plain.final_sum)
+
+
+def test_callable(matrix, distance):
+    testSDS = HierarchicalSDSWrapper(partitions=3, compare=True)
+    testSDS.run(distance, 4, N=len(matrix))
+
+    expected = sds.hierarchical.HierarchicalSDS(matrix, 4, partitions=3, compare=True)
+
+    # Check callable and DataFrame inputs agree
+    pd.testing.assert_frame_equal(testSDS.res, expected.res)
+    assert testSDS.plain_sum == pytest.approx(expected.plain_sum)
+
+
+def test_callable_requires_N(distance):
+    with pytest.raises(ValueError):
+        HierarchicalSDSWrapper().set_matrix(distance)
+
+
+def test_split(matrix):
+    testSDS = HierarchicalSDSWrapper(partitions=3, shuffle=True, random_state=0)
+    testSDS.set_matrix(matrix)
+    groups = testSDS.split()
+
+    # Check every item is assigned exactly once
+    np.testing.assert_array_equal(np.sort(np.concatenate(groups)), np.arange(20))
+
+
+def test_missing_partition():
+    rng = np.random.default_rng(0)
+    points = rng.random((200, 3))
+    values = np.linalg.norm(points[:, None] - points[None], axis=-1)
+    np.fill_diagonal(values, np.nan)
+    values[:60] = np.nan
+    values[:, :60] = np.nan
+    testSDS = sds.hierarchical.HierarchicalSDS(values, 10, partitions=4)
+
+    # Check the partition without data selects nothing
+    assert len(testSDS.partition_res[0]) == 0
+
+    # Check the result only holds items with data
+    assert len(testSDS.indices) == 10
+    assert testSDS.indices.min() >= 60
+
+
+def test_n_partition_too_small(matrix):
+    with pytest.raises(ValueError):
+        sds.hierarchical.HierarchicalSDS(matrix, 10, partitions=4, n_partition=2)
@@ -0,0 +1,41 @@
+import subprocess
+import sys
+
+
+def _run(code):
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+
+
+def test_import_without_pandas():
+    # Importing sds must not load pandas eagerly
+    out = _run("import sds, sys; print('pandas' in sys.modules)")
+    assert out.strip() == "False"
+
+
+def test_search_without_pandas():
+    # Array search and binary I/O run on the numpy-only core
+    code = (
+        "import sys, numpy as np, sds;"
+        "x = np.random.default_rng(0).random((30, 30)); x = x + x.T;"
+        "np.fill_diagonal(x, np.nan);"
+        "s = sds.downselect.SDSWrapper(backend='numpy');"
+        "s.set_matrix(x); s.set_n(5); s.search(); s.post_process(); s.benchmark();"
+        "print(len(s.indices), 'pandas' in sys.modules)"
+    )
+    assert _run(code).split() == ["5", "False"]
+
+
+def test_import_time(record_property):
+    # Track cumulative import time of sds (microseconds) in the test report
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import sds"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    line = [x for x in out.splitlines() if x.rstrip().endswith("| sds")][-1]
+    cumulative = int(line.split("|")[1])
+    record_property("sds_import_us", cumulative)
+    assert cumulative > 0
@@ -1,6 +1,7 @@
 import sds
 import pytest
 import os
+import numpy as np
 import pandas as pd
 
 from tests import localfile
@@ -109,6 +110,43 @@ def test_load_numpy(matrix):
     os.remove(path)
 
 
+def test_load_numpy_array(matrix):
+    # Path to file
+    path = localfile("resources/toy-dataset.npz")
+
+    # Save to file
+    sds.save(path, matrix)
+
+    # Load without pandas
+    testmatrix = sds.io.load_numpy(path, frame=False)
+
+    # Check instance is correct type
+    assert isinstance(testmatrix, np.ndarray)
+    np.testing.assert_array_equal(testmatrix, matrix.to_numpy())
+
+    # Clean up
+    os.remove(path)
+
+
+def test_load_npy(matrix):
+    # Path to file
+    path = localfile("resources/toy-dataset.npy")
+
+    # Save to file
+    sds.save(path, matrix)
+
+    # Load as memory map
+    testmatrix = sds.io.load_npy(path, mmap_mode="r")
+
+    # Check instance is correct type
+    assert isinstance(testmatrix, np.memmap)
+    np.testing.assert_array_equal(testmatrix, matrix.to_numpy())
+
+    # Clean up
+    del testmatrix
+    os.remove(path)
+
+
 @pytest.mark.parametrize(
     "path,instance",
     [
@@ -166,6 +204,23 @@ def test_save_numpy(matrix):
     os.remove(path)
 
 
+def test_save_npy(matrix):
+    # Output path
+    path = localfile("resources/toy-dataset.npy")
+
+    # Save numpy array
+    sds.io.save_npy(path, matrix.to_numpy())
+
+    # Check path exists
+    assert os.path.exists(path)
+
+    # Check not empty
+    assert os.path.getsize(path) > 0
+
+    # Clean up
+    os.remove(path)
+
+
 def test_save_pickle(matrix):
     # Output path
     path = localfile("resources/toy-dataset.pkl")
@@ -0,0 +1,92 @@
+import sds
+import pytest
+import os
+import threading
+import numpy as np
+import pandas as pd
+from sds.prefetch import RowPrefetcher, top_candidates
+
+from tests import localfile
+
+
+@pytest.fixture
+def matrix():
+    return pd.read_csv(localfile("resources/toy-data.csv"))
+
+
+def test_top_candidates():
+    score = np.array([0.5, np.nan, 3.0, -np.inf, 2.0, 1.0])
+
+    # Check highest scores are returned, ignoring NaN
+    assert set(top_candidates(score, 2)) == {2, 4}
+    assert set(top_candidates(score, 10)) == {0, 2, 4, 5}
+
+    # Check restriction to active candidates
+    assert set(top_candidates(score, 2, np.array([0, 1, 5]))) == {0, 5}
+
+
+class TestRowPrefetcher:
+    def test_get(self):
+        reads = []
+        with RowPrefetcher(lambda i: reads.append(i) or i * 10) as prefetcher:
+            prefetcher.prefetch([1, 2])
+
+            # Check prefetched rows are hits
+            assert prefetcher.get(2) == 20
+            assert prefetcher.hits == 1
+
+            # Check other rows are misses
+            assert prefetcher.get(3) == 30
+            assert prefetcher.misses == 1
+
+        assert sorted(reads) == [1, 2, 3]
+
+    def test_prefetch_reads_in_worker(self):
+        values = np.arange(20.0).reshape(4, 5)
+        threads = {}
+
+        def read(i):
+            threads[i] = threading.current_thread()
+            return values[i]
+
+        with RowPrefetcher(read) as prefetcher:
+            prefetcher.prefetch([1, 2])
+            row = prefetcher.get(1)
+            prefetcher.get(2)
+
+        # Check prefetched rows were read off the calling thread
+        assert threading.main_thread() not in (threads[1], threads[2])
+
+        # Check cached rows are copies rather than views of the source
+        np.testing.assert_array_equal(row, values[1])
+        assert not np.shares_memory(row, values)
+
+    def test_cache_size(self):
+        with RowPrefetcher(lambda i: i, cache_size=2) as prefetcher:
+            prefetcher.prefetch([1, 2, 3])
+
+            # Check oldest row was evicted
+            assert len(prefetcher._cache) == 2
+            prefetcher.get(1)
+            assert prefetcher.misses == 1
+
+
+@pytest.mark.parametrize("prune", [False, True])
+def test_search_prefetch(matrix, prune):
+    path = localfile("resources/toy-dataset.npy")
+    sds.save(path, matrix)
+    values = sds.io.load_npy(path, mmap_mode="r")
+
+    testSDS = sds.downselect.SDS(values, 15, prefetch=4, cache_size=8, prune=prune)
+    expected = sds.downselect.SDS(matrix, 15)
+
+    # Check ranking is unchanged by prefetching
+    np.testing.assert_array_equal(testSDS.indices, expected.indices)
+
+    # Check every greedy-step row is counted
+    assert testSDS.cache_hits + testSDS.cache_misses == 13
+    assert testSDS.cache_hits > 0
+
+    # Clean up
+    del values, testSDS
+    os.remove(path)
@@ -0,0 +1,139 @@
+import sds
+import pytest
+import os
+import numpy as np
+import pandas as pd
+from sds.sparse import SparseMatrix
+
+from tests import localfile
+
+
+@pytest.fixture
+def matrix():
+    return pd.read_csv(localfile("resources/toy-data.csv"))
+
+
+@pytest.fixture
+def dense():
+    # Euclidean distances, keeping only pairs within a cutoff
+    points = np.random.default_rng(0).random((80, 2))
+    values = np.linalg.norm(points[:, None] - points[None], axis=-1)
+    values[values > 0.5] = np.nan
+    np.fill_diagonal(values, np.nan)
+    values[5] = np.nan
+    values[:, 5] = np.nan
+    return values
+
+
+def test_from_dense(dense):
+    testmatrix = SparseMatrix.from_dense(dense)
+
+    # Check only known pairs are stored
+    assert testmatrix.nnz == np.count_nonzero(~np.isnan(dense))
+    assert testmatrix.shape == dense.shape
+
+    # Check round trip preserves NaN semantics
+    np.testing.assert_array_equal(testmatrix.todense(), dense)
+    np.testing.assert_array_equal(testmatrix.row(5), dense[5])
+
+
+def test_from_pairs(dense):
+    rows, cols = np.nonzero(np.triu(~np.isnan(dense)))
+    testmatrix = SparseMatrix.from_pairs(rows, cols, dense[rows, cols], len(dense))
+
+    # Check symmetric pairs match the dense matrix
+    np.testing.assert_array_equal(testmatrix.todense(), dense)
+
+
+def test_from_pairs_repeated(dense):
+    rows, cols = np.nonzero(np.triu(~np.isnan(dense)))
+    values = dense[rows, cols]
+
+    # Repeat every pair in reverse, with a different value, plus self pairs
+    testmatrix = SparseMatrix.from_pairs(
+        np.concatenate([rows, cols, [0, 1]]),
+        np.concatenate([cols, rows, [0, 1]]),
+        np.concatenate([values, values + 1, [0.5, 0.5]]),
+        len(dense),
+    )
+
+    # Check first values are kept once and the diagonal stays absent
+    np.testing.assert_array_equal(testmatrix.todense(), dense)
+    np.testing.assert_array_equal(testmatrix.extrema()[2], np.isnan(dense).sum(axis=1))
+
+
+def test_from_pairs_out_of_range():
+    with pytest.raises(ValueError):
+        SparseMatrix.from_pairs([0, 1], [1, 5], [0.5, 0.5], 4)
+
+
+@pytest.mark.parametrize(
+    "indptr,indices",
+    [
+        ([1, 1, 2], [1, 0]),  # pointers not starting at 0
+        ([0, 2, 1], [1, 0]),  # decreasing pointers
+        ([0, 1, 2], [1, 2]),  # column out of range
+        ([0, 1, 2], [0, 0]),  # diagonal entry
+        ([0, 2, 2], [1, 1]),  # repeated entry
+    ],
+)
+def test_invalid(indptr, indices):
+    with pytest.raises(ValueError):
+        SparseMatrix(indptr, indices, [0.5, 0.5])
+
+
+def test_extrema(dense):
+    rowmax, rowmin, count = SparseMatrix.from_dense(dense).extrema()
+    expected = sds.backends.NumpyBackend().extrema(dense)
+
+    # Check against the dense scan
+    np.testing.assert_array_equal(rowmax, expected[0])
+    np.testing.assert_array_equal(rowmin, expected[1])
+    np.testing.assert_array_equal(count, expected[2])
+
+
+def test_submatrix(dense):
+    idx = np.array([7, 2, 40])
+    testmatrix = SparseMatrix.from_dense(dense)
+
+    np.testing.assert_array_equal(
+        sds.utils.submatrix(testmatrix, idx), dense[np.ix_(idx, idx)]
+    )
+
+
+@pytest.mark.parametrize("objective", ["logsum", "sum", "maxmin"])
+@pytest.mark.parametrize("prune", [False, True])
+def test_search(dense, objective, prune):
+    testSDS = sds.downselect.SDS(
+        SparseMatrix.from_dense(dense), 6, objective=objective, prune=prune
+    )
+    expected = sds.downselect.SDS(dense, 6, objective=objective)
+
+    # Check sparse and dense inputs give the same ranking and objective
+    np.testing.assert_array_equal(testSDS.indices, expected.indices)
+    assert testSDS.final_sum == pytest.approx(expected.final_sum)
+
+
+def test_set_n(dense):
+    testSDS = sds.downselect.SDSWrapper()
+    testSDS.set_matrix(SparseMatrix.from_dense(dense))
+
+    # Missing item is not counted towards the population size
+    testSDS.set_n(100)
+    assert testSDS.n == 79
+
+
+def test_save_load(matrix):
+    path = localfile("resources/toy-sparse.npz")
+    testmatrix = SparseMatrix.from_dense(matrix.to_numpy())
+
+    # Save and load through the generic interface
+    sds.save(path, testmatrix)
+    loaded = sds.load(path)
+
+    # Check instance is correct type
+    assert isinstance(loaded, SparseMatrix)
+    np.testing.assert_array_equal(loaded.todense(), matrix.to_numpy())
+
+    # Clean up
+    os.remove(path)
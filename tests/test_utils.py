@@ -1,5 +1,6 @@
 import sds
 import pytest
+import numpy as np
 import pandas as pd
 
 from tests import localfile
@@ -15,3 +16,36 @@ def test_safematrix(matrix):
 
     # test with pandas
     pd.testing.assert_frame_equal(testmatrix, matrix)
+
+
+def test_safematrix_array(matrix):
+    values = matrix.to_numpy()
+    testmatrix = sds.utils.safematrix(values)
+
+    # test with numpy, arrays are not copied
+    assert testmatrix is values
+
+    # test non-square input
+    with pytest.raises(ValueError):
+        sds.utils.safematrix(values[:5])
+
+
+def test_is_dataframe(matrix):
+    assert sds.utils.is_dataframe(matrix)
+    assert not sds.utils.is_dataframe(matrix.to_numpy())
+
+
+def test_submatrix(matrix):
+    idx = np.array([3, 0, 7])
+    expected = matrix.to_numpy()[np.ix_(idx, idx)]
+
+    # test with pandas and numpy
+    np.testing.assert_array_equal(sds.utils.submatrix(matrix, idx), expected)
+    np.testing.assert_array_equal(sds.utils.submatrix(matrix.to_numpy(), idx), expected)
+
+
+def test_ranking():
+    res = sds.utils.ranking(np.array([4, 2]), np.array([1, 2]))
+
+    assert list(res.columns) == ["matrix index", "n Dissimilar"]
+    assert list(res["matrix index"]) == [4, 2]